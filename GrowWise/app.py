@@ -1,6 +1,8 @@
 import os
 import logging
+import orjson
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from werkzeug.middleware.proxy_fix import ProxyFix
 from extensions import db  # ← Use db from extensions.py
@@ -8,10 +10,25 @@ from extensions import db  # ← Use db from extensions.py
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's C encoder instead of stdlib json."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 def create_app():
     app = Flask(__name__)
     app.secret_key = os.environ.get("SESSION_SECRET", "default-secret")
+    app.json = ORJSONProvider(app)
     app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
+    # Cap uploads so oversized images are rejected instead of buffered in RAM,
+    # and spill large multipart bodies to disk past 2 MiB instead of holding
+    # them in memory
+    app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024
+    app.config["MAX_FORM_MEMORY_SIZE"] = 2 * 1024 * 1024
 
     # DB Config
     database_url = os.environ.get("DATABASE_URL", "sqlite:///growwise.db")
@@ -29,6 +46,19 @@ def create_app():
     CORS(app)
 
     with app.app_context():
+        if database_url.startswith("sqlite"):
+            from sqlalchemy import event
+
+            @event.listens_for(db.engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                # WAL lets readers run during writes and turns most commits
+                # into a log append; NORMAL sync is safe under WAL and drops
+                # an fsync per transaction
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.close()
+
         from db_models import Prediction, WeatherQuery, VoiceQuery, MarketPrice
         db.create_all()
         logger.info("✅ Database tables created")
@@ -36,9 +66,15 @@ def create_app():
         from routes import main_bp
         app.register_blueprint(main_bp)
 
+        from db_models import db_manager
+        db_manager.start_writer(app)
+
     return app
 
 app = create_app()
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # Threaded explicitly: PIL decode and the NumPy reductions release the
+    # GIL, so concurrent uploads analyze in parallel instead of queueing
+    # behind one request thread
+    app.run(host="0.0.0.0", port=5000, debug=True, threaded=True)
@@ -10,59 +10,116 @@ class PlantDiseaseCNN(nn.Module):
     def __init__(self, num_classes: int):
         super(PlantDiseaseCNN, self).__init__()
         
+        # Standard Conv -> BN -> ReLU ordering: BatchNorm directly follows
+        # its conv so eval-time fusion (see fuse()) can fold each BN into
+        # the preceding convolution
         self.conv_layers = nn.Sequential(
             # First convolutional block
             nn.Conv2d(in_channels=3, out_channels=32, kernel_size=3, padding=1),
-            nn.ReLU(inplace=True),
             nn.BatchNorm2d(32),
-            nn.Conv2d(in_channels=32, out_channels=32, kernel_size=3, padding=1),
             nn.ReLU(inplace=True),
+            nn.Conv2d(in_channels=32, out_channels=32, kernel_size=3, padding=1),
             nn.BatchNorm2d(32),
+            nn.ReLU(inplace=True),
             nn.MaxPool2d(kernel_size=2, stride=2),
-            
+
             # Second convolutional block
             nn.Conv2d(in_channels=32, out_channels=64, kernel_size=3, padding=1),
-            nn.ReLU(inplace=True),
             nn.BatchNorm2d(64),
-            nn.Conv2d(in_channels=64, out_channels=64, kernel_size=3, padding=1),
             nn.ReLU(inplace=True),
+            nn.Conv2d(in_channels=64, out_channels=64, kernel_size=3, padding=1),
             nn.BatchNorm2d(64),
+            nn.ReLU(inplace=True),
             nn.MaxPool2d(kernel_size=2, stride=2),
-            
+
             # Third convolutional block
             nn.Conv2d(in_channels=64, out_channels=128, kernel_size=3, padding=1),
-            nn.ReLU(inplace=True),
             nn.BatchNorm2d(128),
-            nn.Conv2d(in_channels=128, out_channels=128, kernel_size=3, padding=1),
             nn.ReLU(inplace=True),
+            nn.Conv2d(in_channels=128, out_channels=128, kernel_size=3, padding=1),
             nn.BatchNorm2d(128),
+            nn.ReLU(inplace=True),
             nn.MaxPool2d(kernel_size=2, stride=2),
-            
+
             # Fourth convolutional block
             nn.Conv2d(in_channels=128, out_channels=256, kernel_size=3, padding=1),
-            nn.ReLU(inplace=True),
             nn.BatchNorm2d(256),
-            nn.Conv2d(in_channels=256, out_channels=256, kernel_size=3, padding=1),
             nn.ReLU(inplace=True),
+            nn.Conv2d(in_channels=256, out_channels=256, kernel_size=3, padding=1),
             nn.BatchNorm2d(256),
+            nn.ReLU(inplace=True),
             nn.MaxPool2d(kernel_size=2, stride=2),
         )
 
+        # Global average pool head: the old Linear(50176, 1024) held ~51M
+        # weights (~200MB FP32) and dominated model size; pooling to one
+        # value per channel leaves a 256 -> num_classes projection
         self.classifier = nn.Sequential(
+            nn.AdaptiveAvgPool2d(1),
+            nn.Flatten(),
             nn.Dropout(0.4),
-            nn.Linear(50176, 1024),
-            nn.ReLU(inplace=True),
-            nn.Dropout(0.4),
-            nn.Linear(1024, num_classes),
+            nn.Linear(256, num_classes),
         )
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """Forward pass through the network."""
         features = self.conv_layers(x)
-        features = features.view(features.size(0), -1)
         output = self.classifier(features)
         return output
 
+    def fuse(self) -> 'PlantDiseaseCNN':
+        """Fold each eval-mode BatchNorm into its preceding conv.
+
+        Call after load_state_dict() + eval(); every fused BN removes one
+        full pass over the feature map at inference time. Fusion bakes the
+        running statistics into the conv weights, so it is eval-only.
+        """
+        from torch.nn.utils.fusion import fuse_conv_bn_eval
+
+        if self.training:
+            raise RuntimeError("fuse() requires eval mode")
+
+        layers = list(self.conv_layers)
+        fused = []
+        i = 0
+        while i < len(layers):
+            if (isinstance(layers[i], nn.Conv2d) and i + 1 < len(layers)
+                    and isinstance(layers[i + 1], nn.BatchNorm2d)):
+                fused.append(fuse_conv_bn_eval(layers[i], layers[i + 1]))
+                i += 2
+            else:
+                fused.append(layers[i])
+                i += 1
+        self.conv_layers = nn.Sequential(*fused)
+        return self
+
+    def prepare_for_inference(self) -> 'PlantDiseaseCNN':
+        """One-time conversion of a CUDA-resident model for serving.
+
+        Casts the weights to float16 in channels-last layout — half the
+        bytes per feature-map pass and Tensor Core matmuls. Call once after
+        load_state_dict() + eval(); converting here keeps forward_inference
+        free of parameter mutation, so a model kept in FP32 for training is
+        never silently converted by serving a request. No-op on CPU.
+        """
+        self.eval()
+        if next(self.parameters()).is_cuda:
+            self.half().to(memory_format=torch.channels_last)
+        return self
+
+    def forward_inference(self, x: torch.Tensor) -> torch.Tensor:
+        """Inference-only forward pass tuned for throughput.
+
+        Assumes prepare_for_inference() already converted a CUDA model to
+        float16/channels-last; only the input is cast to match here, so
+        repeated calls never touch the parameters. Training keeps the plain
+        FP32 NCHW forward above.
+        """
+        if x.is_cuda:
+            x = x.half().contiguous(memory_format=torch.channels_last)
+        with torch.inference_mode():
+            return self(x)
+
 # Disease class mappings
 DISEASE_CLASSES: Dict[int, str] = {
     0: 'Apple___Apple_scab', 1: 'Apple___Black_rot', 2: 'Apple___Cedar_apple_rust',
@@ -1,30 +1,43 @@
 """Configuration settings for the GrowWise API."""
 
 import os
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Tuple
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings and configuration."""
-    
+    """Application settings and configuration.
+
+    Frozen with slots so instances are immutable, cheap to share, and env
+    vars are resolved exactly once via get_settings().
+    """
+
     # API Configuration
-    TITLE = "GrowWise API"
-    DESCRIPTION = "Smart Farming Assistant API with Disease Detection, Weather, and Market Prices"
-    VERSION = "1.0.0"
-    
+    TITLE: str = "GrowWise API"
+    DESCRIPTION: str = "Smart Farming Assistant API with Disease Detection, Weather, and Market Prices"
+    VERSION: str = "1.0.0"
+
     # External API Keys
-    OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY", "7a695b51212a8a83fa11b8fab774eb02")
-    
+    OPENWEATHER_API_KEY: str = field(
+        default_factory=lambda: os.getenv("OPENWEATHER_API_KEY", "7a695b51212a8a83fa11b8fab774eb02")
+    )
+
     # File Paths
-    MODEL_PATH = os.getenv("MODEL_PATH", "/home/dijo/dev_hack/Plant-Disease-Detection/Model/plant_disease_model_1_latest.pt")
-    DATABASE_PATH = os.getenv("DATABASE_PATH", "growwise_app.db")
-    
+    MODEL_PATH: str = field(
+        default_factory=lambda: os.getenv("MODEL_PATH", "/home/dijo/dev_hack/Plant-Disease-Detection/Model/plant_disease_model_1_latest.pt")
+    )
+    DATABASE_PATH: str = field(
+        default_factory=lambda: os.getenv("DATABASE_PATH", "growwise_app.db")
+    )
+
     # CORS Settings
-    CORS_ORIGINS = ["*"]
-    CORS_METHODS = ["*"]
-    CORS_HEADERS = ["*"]
-    
+    CORS_ORIGINS: Tuple[str, ...] = ("*",)
+    CORS_METHODS: Tuple[str, ...] = ("*",)
+    CORS_HEADERS: Tuple[str, ...] = ("*",)
+
     # Selenium Configuration
-    CHROME_OPTIONS = [
+    CHROME_OPTIONS: Tuple[str, ...] = (
         '--headless=new',
         '--no-sandbox',
         '--disable-dev-shm-usage',
@@ -32,12 +45,23 @@ class Settings:
         '--disable-extensions',
         '--disable-logging',
         '--silent'
-    ]
-    
+    )
+
+    # Set when the market pages start requiring JS rendering; forces the
+    # scraper back onto Selenium instead of the plain HTTP fetch
+    MARKET_REQUIRES_JS: bool = field(
+        default_factory=lambda: os.getenv("MARKET_REQUIRES_JS", "0") == "1"
+    )
+
     # Market Price URLs
-    MARKET_URLS = {
+    MARKET_URLS: Dict[str, str] = field(default_factory=lambda: {
         'Vegetable': 'https://www.livechennai.com/Vegetable_price_chennai.asp',
         'Fruit': 'https://www.livechennai.com/Fruits_price_chennai.asp'
-    }
+    })
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the shared Settings instance, constructing it on first use."""
+    return Settings()
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
@@ -2,6 +2,8 @@
 
 import sqlite3
 import logging
+import threading
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from contextlib import contextmanager
@@ -12,23 +14,108 @@ logger = logging.getLogger(__name__)
 
 class DatabaseManager:
     """Manages database operations for the GrowWise application."""
-    
+
+    # Row lifetimes for the TTL-evicted tables
+    WEATHER_TTL_SECONDS = 3600
+    MARKET_TTL_SECONDS = 86400
+
+    # Expired rows are cleaned up by a periodic sweep rather than inline on
+    # the write path, so saves never pay housekeeping latency
+    SWEEP_INTERVAL_SECONDS = 900
+
+    # Stats are not real-time critical; serve them from a short cache
+    # instead of re-running the counts per call
+    STATS_TTL_SECONDS = 30
+
+    # Hot-path INSERTs, hoisted so every call binds against the same cached
+    # statement text instead of rebuilding the SQL string
+    _INSERT_PREDICTION = "INSERT INTO predictions (disease, confidence, treatment) VALUES (?, ?, ?)"
+    _INSERT_WEATHER = (
+        "INSERT INTO weather_cache "
+        "(city, temperature, description, humidity, wind_speed, expires_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)"
+    )
+    _INSERT_VOICE_QUERY = "INSERT INTO user_queries (query, response) VALUES (?, ?)"
+
     def __init__(self, db_path: str = settings.DATABASE_PATH):
         self.db_path = db_path
+        self._local = threading.local()
+        self._stats_cache = None
+        self._stats_cached_at = 0.0
         self.init_database()
-    
+        self._schedule_sweep()
+
+    def _schedule_sweep(self) -> None:
+        """Arm the next TTL eviction sweep."""
+        timer = threading.Timer(self.SWEEP_INTERVAL_SECONDS, self._sweep_expired)
+        timer.daemon = True
+        timer.start()
+
+    def _sweep_expired(self) -> None:
+        """Delete expired market price rows via the expires_at index, then rearm.
+
+        weather_cache is deliberately not swept: it doubles as the source of
+        get_weather_history, and those rows were never deleted before. Its
+        expires_at column only marks cache staleness.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "DELETE FROM market_prices WHERE expires_at < ?",
+                    (int(time.time()),)
+                )
+                conn.commit()
+        except Exception as e:
+            logger.error(f"TTL sweep failed: {e}")
+        finally:
+            self._schedule_sweep()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the performance PRAGMAs applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # WAL lets readers run during writes and turns most commits into a
+        # sequential log append; NORMAL sync is safe under WAL and drops an
+        # fsync per transaction
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
+
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
+        """Context manager yielding this thread's persistent connection.
+
+        Connections are kept per thread so every call reuses the statement
+        cache and warmed page cache instead of paying file-open cost.
+        """
+        conn = self._thread_conn()
         try:
             yield conn
         except Exception as e:
             conn.rollback()
             logger.error(f"Database error: {e}")
             raise
-        finally:
-            conn.close()
+
+    def _thread_conn(self) -> sqlite3.Connection:
+        """Get or create this thread's persistent connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def _get_cursor(self) -> sqlite3.Cursor:
+        """Return this thread's long-lived cursor for the hot INSERT paths.
+
+        Reusing one cursor against the persistent connection keeps the
+        prepared statements warm in SQLite's per-connection cache, so each
+        save is effectively bind + step + reset.
+        """
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self._local.cursor = self._thread_conn().cursor()
+        return cursor
     
     def init_database(self) -> None:
         """Initialize database tables."""
@@ -80,33 +167,60 @@ class DatabaseManager:
                 )
             ''')
             
+            # TTL bookkeeping: expires_at is an indexed unix timestamp so
+            # eviction is an indexed range delete instead of the old
+            # datetime(timestamp) comparison, which forced a full scan.
+            # Pre-migration rows are backfilled with a fresh TTL so the
+            # sweep never treats them as already expired.
+            for table, ttl in (('weather_cache', self.WEATHER_TTL_SECONDS),
+                               ('market_prices', self.MARKET_TTL_SECONDS)):
+                columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+                if 'expires_at' not in columns:
+                    cursor.execute(f"ALTER TABLE {table} ADD COLUMN expires_at INTEGER")
+                    cursor.execute(
+                        f"UPDATE {table} SET expires_at = ? WHERE expires_at IS NULL",
+                        (int(time.time()) + ttl,)
+                    )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS ix_weather_expires ON weather_cache(expires_at)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS ix_market_expires ON market_prices(expires_at)"
+            )
+
+            # The history queries are ORDER BY timestamp DESC LIMIT ?; these
+            # indexes turn the full scan + sort into an O(limit) range walk
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS ix_pred_ts ON predictions(timestamp DESC)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS ix_weather_ts ON weather_cache(timestamp DESC)"
+            )
+
             conn.commit()
             logger.info("Database initialized successfully")
     
     def save_prediction(self, disease: str, confidence: float, treatment: str) -> None:
         """Save disease prediction to database."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO predictions (disease, confidence, treatment) VALUES (?, ?, ?)",
+            self._get_cursor().execute(
+                self._INSERT_PREDICTION,
                 (disease, confidence, treatment)
             )
             conn.commit()
-    
+
     def save_weather_data(self, weather_data: Dict[str, Any]) -> None:
         """Save weather data to database."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """INSERT INTO weather_cache 
-                   (city, temperature, description, humidity, wind_speed) 
-                   VALUES (?, ?, ?, ?, ?)""",
+            self._get_cursor().execute(
+                self._INSERT_WEATHER,
                 (
                     weather_data['city'],
                     weather_data['temperature'],
                     weather_data['description'],
                     weather_data['humidity'],
-                    weather_data['wind_speed']
+                    weather_data['wind_speed'],
+                    int(time.time()) + self.WEATHER_TTL_SECONDS
                 )
             )
             conn.commit()
@@ -116,28 +230,20 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Clear old prices (older than 1 day)
-            cursor.execute(
-                "DELETE FROM market_prices WHERE datetime(timestamp) < datetime('now', '-1 day')"
+            # Insert new prices in one executemany: the statement is parsed
+            # once and every row lands in the same transaction
+            expires_at = int(time.time()) + self.MARKET_TTL_SECONDS
+            cursor.executemany(
+                "INSERT INTO market_prices (category, name, price, expires_at) VALUES (?, ?, ?, ?)",
+                [(item['category'], item['name'], item['price'], expires_at) for item in prices]
             )
-            
-            # Insert new prices
-            for item in prices:
-                cursor.execute(
-                    "INSERT INTO market_prices (category, name, price) VALUES (?, ?, ?)",
-                    (item['category'], item['name'], item['price'])
-                )
-            
+
             conn.commit()
     
     def save_voice_query(self, query: str, response: str) -> None:
         """Save voice query and response to database."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO user_queries (query, response) VALUES (?, ?)",
-                (query, response)
-            )
+            self._get_cursor().execute(self._INSERT_VOICE_QUERY, (query, response))
             conn.commit()
     
     def get_prediction_history(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -188,21 +294,23 @@ class DatabaseManager:
     
     def get_app_stats(self) -> Dict[str, Any]:
         """Get application usage statistics."""
+        now = time.time()
+        if self._stats_cache is not None and now - self._stats_cached_at < self.STATS_TTL_SECONDS:
+            return self._stats_cache
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            
-            # Get total predictions
-            cursor.execute("SELECT COUNT(*) FROM predictions")
-            total_predictions = cursor.fetchone()[0]
-            
-            # Get total weather queries
-            cursor.execute("SELECT COUNT(*) FROM weather_cache")
-            weather_queries = cursor.fetchone()[0]
-            
-            # Get total voice queries
-            cursor.execute("SELECT COUNT(*) FROM user_queries")
-            voice_queries = cursor.fetchone()[0]
-            
+
+            # All three counts in one round-trip instead of three parses
+            # and three scalar queries
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM predictions),
+                    (SELECT COUNT(*) FROM weather_cache),
+                    (SELECT COUNT(*) FROM user_queries)
+            """)
+            total_predictions, weather_queries, voice_queries = cursor.fetchone()
+
             # Get most common diseases
             cursor.execute("""
                 SELECT disease, COUNT(*) as count
@@ -212,16 +320,27 @@ class DatabaseManager:
                 LIMIT 5
             """)
             common_diseases = [
-                {'disease': row[0], 'count': row[1]} 
+                {'disease': row[0], 'count': row[1]}
                 for row in cursor.fetchall()
             ]
-            
-            return {
+
+            stats = {
                 'total_predictions': total_predictions,
                 'weather_queries': weather_queries,
                 'voice_queries': voice_queries,
                 'common_diseases': common_diseases
             }
+            self._stats_cache = stats
+            self._stats_cached_at = now
+            return stats
+
+# Constructed lazily so importing this module doesn't open the database
+# file or run CREATE TABLE; first use pays the initialization cost once
+_db_manager: Optional[DatabaseManager] = None
 
-# Global database instance
-db_manager = DatabaseManager()
\ No newline at end of file
+def get_db() -> DatabaseManager:
+    """Return the shared DatabaseManager, creating it on first call."""
+    global _db_manager
+    if _db_manager is None:
+        _db_manager = DatabaseManager()
+    return _db_manager
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import torch
 import logging
+import numpy as np
 from torchvision import transforms
 from PIL import Image
 import io
@@ -9,6 +10,11 @@ import os
 from typing import Dict
 from fastapi import HTTPException
 
+try:
+    import tensorrt as trt
+except ImportError:
+    trt = None
+
 from ..config import settings
 from ..models.cnn_model import PlantDiseaseCNN, DISEASE_CLASSES, TREATMENT_RECOMMENDATIONS
 
@@ -17,23 +23,143 @@ logger = logging.getLogger(__name__)
 class DiseaseDetectionService:
     """Service for plant disease detection using CNN model."""
     
+    # Preprocessing pipeline is stateless; share it across instances and
+    # pre-forked workers instead of rebuilding per construction
+    transform = transforms.Compose([
+        transforms.Resize((224, 224)),
+        transforms.ToTensor(),
+        transforms.Normalize(
+            mean=[0.485, 0.456, 0.406],
+            std=[0.229, 0.224, 0.225]
+        )
+    ])
+
     def __init__(self):
         self.model = None
-        self.transform = None
         self.num_classes = len(DISEASE_CLASSES)
+        self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        self.dtype = torch.float32
+        self.trt_engine = None
+        self.trt_context = None
+        # Class vocabulary is fixed, so evaluate the display-name transform
+        # once at startup instead of per prediction
+        self._formatted_names = {
+            key: key.replace('___', ' - ').replace('_', ' ')
+            for key in DISEASE_CLASSES.values()
+        }
+        # Allow TF32 matmuls for any ops that stay in FP32
+        torch.set_float32_matmul_precision('high')
         self._load_model()
         self._setup_transforms()
-    
+
+    def _load_trt_engine(self) -> bool:
+        """
+        Load a pre-built TensorRT FP16 engine if one exists next to the model.
+
+        The engine is produced offline via `export_onnx` followed by
+        `trtexec --onnx=disease.onnx --fp16 --saveEngine=<MODEL_PATH>.plan`.
+
+        Returns:
+            True if the engine was loaded and buffers allocated
+        """
+        engine_path = settings.MODEL_PATH + ".plan"
+        if trt is None or not torch.cuda.is_available() or not os.path.exists(engine_path):
+            return False
+
+        try:
+            runtime = trt.Runtime(trt.Logger(trt.Logger.WARNING))
+            with open(engine_path, 'rb') as f:
+                self.trt_engine = runtime.deserialize_cuda_engine(f.read())
+            self.trt_context = self.trt_engine.create_execution_context()
+
+            # Persistent device buffers reused across requests
+            self._trt_input = torch.empty((1, 3, 224, 224), dtype=torch.float16, device='cuda')
+            self._trt_output = torch.empty((1, self.num_classes), dtype=torch.float16, device='cuda')
+
+            logger.info("TensorRT FP16 engine loaded successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Error loading TensorRT engine, falling back to PyTorch: {e}")
+            self.trt_engine = None
+            self.trt_context = None
+            return False
+
+    def export_onnx(self, onnx_path: str) -> None:
+        """
+        Export the FP32 model to ONNX for offline TensorRT engine builds.
+
+        Args:
+            onnx_path: Destination path for the ONNX graph
+        """
+        dummy = torch.zeros(1, 3, 224, 224)
+        torch.onnx.export(
+            self.model, dummy, onnx_path,
+            opset_version=17,
+            input_names=['input'], output_names=['output'],
+            dynamic_axes={'input': {0: 'b'}}
+        )
+
+    def _save_quantized_weights(self) -> None:
+        """Persist the int8 state_dict next to the FP32 checkpoint once."""
+        int8_path = settings.MODEL_PATH + ".int8.pt"
+        if os.path.exists(int8_path):
+            return
+        try:
+            torch.save(self.model.state_dict(), int8_path)
+            logger.info(f"Saved int8 weights to {int8_path}")
+        except Exception as e:
+            logger.warning(f"Could not save int8 weights: {e}")
+
     def _load_model(self) -> None:
         """Load the pre-trained CNN model."""
+        if self._load_trt_engine():
+            return
+
         try:
             self.model = PlantDiseaseCNN(self.num_classes)
-            
+
             if os.path.exists(settings.MODEL_PATH):
-                state_dict = torch.load(settings.MODEL_PATH, map_location='cpu')
+                try:
+                    # mmap keeps weights page-backed so pre-forked Gunicorn
+                    # workers share them copy-on-write instead of each holding
+                    # a private copy
+                    state_dict = torch.load(settings.MODEL_PATH, map_location='cpu', mmap=True, weights_only=True)
+                except TypeError:
+                    # PyTorch < 2.1 has no mmap/weights_only arguments
+                    state_dict = torch.load(settings.MODEL_PATH, map_location='cpu')
                 self.model.load_state_dict(state_dict)
                 self.model.eval()
-                logger.info("Disease detection model loaded successfully")
+                self.model.to(self.device)
+                # Half precision only on Tensor-Core capable GPUs (compute >= 7.0);
+                # CPUs and older GPUs stay in FP32 to avoid cast penalties
+                if self.device == 'cuda' and torch.cuda.get_device_capability()[0] >= 7:
+                    self.model.half()
+                    self.dtype = torch.float16
+                # CPUs rarely benefit from FP16; int8 halves weight bandwidth
+                # and uses VNNI dot-product instructions where available, so
+                # it is the default serve path (GROWWISE_QUANTIZE=0 opts out).
+                # BNs are folded into their convs first so quantization sees
+                # the final weights; dynamic quantization covers Linear —
+                # int8 convs need the static fx flow with a calibration set.
+                elif self.device == 'cpu' and os.environ.get('GROWWISE_QUANTIZE', '1') != '0':
+                    try:
+                        self.model.fuse()
+                    except Exception as e:
+                        logger.warning(f"Conv+BN fusion skipped: {e}")
+                    self.model = torch.ao.quantization.quantize_dynamic(
+                        self.model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                    self._save_quantized_weights()
+                    logger.info("Applied dynamic int8 quantization for CPU inference")
+                if hasattr(torch, 'compile'):
+                    try:
+                        self.model = torch.compile(self.model, mode='reduce-overhead', fullgraph=True)
+                        # Warm up once so compilation cost doesn't hit the first real request
+                        with torch.inference_mode():
+                            self.model(torch.zeros(1, 3, 224, 224, device=self.device, dtype=self.dtype))
+                    except Exception as e:
+                        logger.warning(f"torch.compile unavailable, keeping eager model: {e}")
+                logger.info(f"Disease detection model loaded successfully (device={self.device}, dtype={self.dtype})")
             else:
                 logger.warning(f"Model file not found at {settings.MODEL_PATH}. Disease detection will use fallback mode.")
                 self.model = None
@@ -43,19 +169,51 @@ class DiseaseDetectionService:
             self.model = None
     
     def _setup_transforms(self) -> None:
-        """Setup image preprocessing transforms."""
-        self.transform = transforms.Compose([
-            transforms.Resize((224, 224)),
-            transforms.ToTensor(),
-            transforms.Normalize(
-                mean=[0.485, 0.456, 0.406], 
-                std=[0.229, 0.224, 0.225]
-            )
-        ])
+        """Setup device-side preprocessing state."""
+        if self.device == 'cuda':
+            # Normalization constants kept resident on the GPU
+            self.mean_gpu = torch.tensor([0.485, 0.456, 0.406], device=self.device, dtype=self.dtype).view(1, 3, 1, 1)
+            self.std_gpu = torch.tensor([0.229, 0.224, 0.225], device=self.device, dtype=self.dtype).view(1, 3, 1, 1)
+            # Persistent pinned host staging buffer and dedicated stream:
+            # page-locking is the expensive part of pinned transfers, so the
+            # buffer is allocated once here (grown only if a larger frame
+            # arrives) and H2D copies from it can overlap in-flight compute
+            self._h_staging = torch.empty(0, dtype=torch.uint8, pin_memory=True)
+            self._stream = torch.cuda.Stream()
+
+    def _preprocess(self, image: Image.Image) -> torch.Tensor:
+        """
+        Preprocess a decoded PIL image into a normalized 1x3x224x224 tensor.
+
+        On CUDA the CPU only decodes to uint8; resize and normalize run as GPU
+        kernels, with the host-to-device copy staged through pinned memory so it
+        can overlap with in-flight compute.
+        """
+        if self.device != 'cuda':
+            return self.transform(image).unsqueeze(0)
+
+        arr = np.asarray(image, dtype=np.uint8)
+        tensor = self._stage_frame(arr).to(self.device, non_blocking=True)
+        tensor = tensor.permute(2, 0, 1).unsqueeze(0).to(self.dtype).div_(255.0)
+        tensor = torch.nn.functional.interpolate(tensor, size=(224, 224), mode='bilinear', align_corners=False)
+        return tensor.sub_(self.mean_gpu).div_(self.std_gpu)
+
+    def _stage_frame(self, arr: np.ndarray) -> torch.Tensor:
+        """Copy a decoded frame into the persistent pinned staging buffer.
+
+        Returns a pinned view shaped like the frame; the buffer grows only
+        when a larger frame than any seen before arrives.
+        """
+        flat = torch.from_numpy(arr).reshape(-1)
+        if self._h_staging.numel() < flat.numel():
+            self._h_staging = torch.empty(flat.numel(), dtype=torch.uint8, pin_memory=True)
+        staged = self._h_staging[:flat.numel()]
+        staged.copy_(flat)
+        return staged.view(arr.shape)
     
     def is_model_available(self) -> bool:
         """Check if the model is loaded and available."""
-        return self.model is not None and self.transform is not None
+        return (self.model is not None or self.trt_context is not None) and self.transform is not None
     
     def predict_disease(self, image_bytes: bytes) -> Dict[str, any]:
         """
@@ -83,13 +241,17 @@ class DiseaseDetectionService:
         try:
             # Load and preprocess image
             image = Image.open(io.BytesIO(image_bytes)).convert('RGB')
-            tensor = self.transform(image).unsqueeze(0)
 
             # Make prediction
-            with torch.no_grad():
-                outputs = self.model(tensor)
-                probabilities = torch.nn.functional.softmax(outputs, dim=1)
-                confidence, predicted_idx = torch.max(probabilities, 1)
+            if self.device == 'cuda':
+                # Run preprocessing, upload, and forward on the dedicated
+                # stream so this request's copies overlap other requests'
+                # kernels instead of serializing on the default stream
+                with torch.cuda.stream(self._stream):
+                    confidence, predicted_idx = self._forward(self._preprocess(image))
+                self._stream.synchronize()
+            else:
+                confidence, predicted_idx = self._forward(self._preprocess(image))
 
             # Get results
             disease_key = DISEASE_CLASSES[predicted_idx.item()]
@@ -118,6 +280,26 @@ class DiseaseDetectionService:
                 detail="Error processing image for disease detection"
             )
     
+    def _forward(self, tensor: torch.Tensor) -> tuple:
+        """
+        Run the TensorRT engine or PyTorch model on a preprocessed tensor.
+
+        Args:
+            tensor: Normalized 1x3x224x224 input tensor
+
+        Returns:
+            Tuple of (confidence, predicted_idx) tensors
+        """
+        with torch.inference_mode():
+            if self.trt_context is not None:
+                self._trt_input.copy_(tensor.to('cuda', dtype=torch.float16))
+                self.trt_context.execute_v2([self._trt_input.data_ptr(), self._trt_output.data_ptr()])
+                outputs = self._trt_output.float().cpu()
+            else:
+                outputs = self.model(tensor)
+            probabilities = torch.nn.functional.softmax(outputs, dim=1)
+            return torch.max(probabilities, 1)
+
     def _format_disease_name(self, disease_key: str) -> str:
         """
         Format disease name for human-readable display.
@@ -128,7 +310,7 @@ class DiseaseDetectionService:
         Returns:
             Formatted disease name
         """
-        return disease_key.replace('___', ' - ').replace('_', ' ')
+        return self._formatted_names[disease_key]
 
 # Global disease service instance
 disease_service = DiseaseDetectionService()
\ No newline at end of file
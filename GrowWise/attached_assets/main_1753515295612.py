@@ -4,12 +4,14 @@ import logging
 import uvicorn
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from .config import settings
 from .api.routes import router
-from .database.database import db_manager
+from .database.database import get_db
 
 # Configure logging
 logging.basicConfig(
@@ -23,9 +25,9 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     logger.info("🚀 GrowWise API starting up...")
     
-    # Initialize database
+    # Initialize database (construction runs init_database exactly once)
     try:
-        db_manager.init_database()
+        get_db()
         logger.info("✅ Database initialized successfully")
     except Exception as e:
         logger.error(f"❌ Database initialization failed: {e}")
@@ -50,7 +52,10 @@ def create_app() -> FastAPI:
         version=settings.VERSION,
         lifespan=lifespan,
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        # orjson's C encoder handles datetimes and floats natively, so
+        # history/stats payloads skip the stdlib json slow path
+        default_response_class=ORJSONResponse
     )
 
     # Add CORS middleware
@@ -68,9 +73,22 @@ def create_app() -> FastAPI:
         allowed_hosts=["*"]  # Configure this for production
     )
 
-    # Include API routes
+    # History/stats responses are repetitive JSON that compresses 5-10x;
+    # tiny payloads below the threshold skip the compressor entirely
+    app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=6)
+
+    # Include API routes once: registering the router a second time for the
+    # unprefixed legacy paths doubled the entries Starlette linear-scans on
+    # every request. Legacy paths are rewritten into /api/v1 instead.
     app.include_router(router, prefix="/api/v1")
-    app.include_router(router)  # Also include without prefix for backward compatibility
+
+    @app.middleware("http")
+    async def rewrite_legacy_paths(request, call_next):
+        """Map old unprefixed API paths onto /api/v1 before routing."""
+        path = request.scope["path"]
+        if not path.startswith(("/api/v1", "/docs", "/redoc", "/openapi.json")):
+            request.scope["path"] = "/api/v1" + path
+        return await call_next(request)
 
     return app
 
@@ -1,9 +1,15 @@
 """Market price scraping service."""
 
 import re
+import atexit
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
+import httpx
+from selectolax.parser import HTMLParser
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -13,19 +19,77 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Compiled once: the scrape loop runs this against every line of the page,
+# so skip re's per-call cache lookup
+_PRICE_RE = re.compile(r'^(.*\D)\s+(\d+\.?\d*)$')
+
 class MarketPriceService:
     """Service for scraping market prices from Chennai live website."""
     
     def __init__(self):
         self.urls = settings.MARKET_URLS
         self.chrome_options = self._get_chrome_options()
-    
+        # Chrome startup dominates scrape wall time, so each pool thread
+        # keeps its own driver alive and reuses it across runs instead of
+        # booting per call. The pool is persistent so thread identities (and
+        # their drivers) survive between scrapes.
+        self._local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max(len(self.urls), 1))
+        # The price pages render without JS, so the default path is a plain
+        # HTTP fetch + HTML parse; Selenium stays as the fallback (and the
+        # forced path when MARKET_REQUIRES_JS is set)
+        self.http = httpx.Client(
+            timeout=10,
+            follow_redirects=True,
+            headers={"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) GrowWise/1.0"}
+        )
+        atexit.register(self._shutdown)
+
     def _get_chrome_options(self) -> Options:
         """Configure Chrome options for headless browsing."""
         options = Options()
         for option in settings.CHROME_OPTIONS:
             options.add_argument(option)
         return options
+
+    def _get_driver(self) -> webdriver.Chrome:
+        """Return this thread's driver, creating or replacing it if needed."""
+        driver = getattr(self._local, 'driver', None)
+        if driver is not None:
+            try:
+                # Cheap liveness probe; a dead Chrome raises here
+                _ = driver.current_url
+                return driver
+            except WebDriverException:
+                logger.warning("WebDriver died; restarting Chrome")
+                self._quit_driver(driver)
+        driver = webdriver.Chrome(options=self.chrome_options)
+        self._local.driver = driver
+        with self._drivers_lock:
+            self._drivers.append(driver)
+        return driver
+
+    def _quit_driver(self, driver: webdriver.Chrome) -> None:
+        """Tear down one driver, ignoring shutdown errors."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+
+    def _shutdown(self) -> None:
+        """atexit hook: close every thread's browser with the process."""
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
     
     def _parse_price_line(self, line: str, category: str) -> Dict[str, str]:
         """
@@ -53,7 +117,7 @@ class MarketPriceService:
                 }
         
         # Format: "Item 245.00"
-        match = re.match(r'^(.*\D)\s+(\d+\.?\d*)$', line)
+        match = _PRICE_RE.match(line)
         if match:
             name = match.group(1).strip()
             price = match.group(2).strip()
@@ -96,7 +160,31 @@ class MarketPriceService:
             logger.error(f"Error scraping {category} prices: {e}")
         
         return prices
-    
+
+    def _fetch_category_prices(self, category: str, url: str) -> List[Dict[str, str]]:
+        """Fetch and parse one category without a browser."""
+        response = self.http.get(url)
+        response.raise_for_status()
+
+        prices = []
+        body = HTMLParser(response.text).body
+        if body is not None:
+            for line in body.text(separator='\n').split('\n'):
+                parsed_price = self._parse_price_line(line, category)
+                if parsed_price:
+                    prices.append(parsed_price)
+        return prices
+
+    def _scrape_one(self, category: str, url: str) -> List[Dict[str, str]]:
+        """Scrape one category, preferring the browserless HTTP path."""
+        if not getattr(settings, 'MARKET_REQUIRES_JS', False):
+            try:
+                return self._fetch_category_prices(category, url)
+            except Exception as e:
+                logger.warning(f"HTTP scrape failed for {category}, falling back to Selenium: {e}")
+        driver = self._get_driver()
+        return self._scrape_category_prices(driver, category, url)
+
     def get_market_prices(self) -> List[Dict[str, str]]:
         """
         Scrape market prices from all configured sources.
@@ -105,16 +193,17 @@ class MarketPriceService:
             List of price dictionaries
         """
         all_prices = []
-        
+
         try:
-            driver = webdriver.Chrome(options=self.chrome_options)
-            
-            for category, url in self.urls.items():
-                category_prices = self._scrape_category_prices(driver, category, url)
-                all_prices.extend(category_prices)
-            
-            driver.quit()
-            
+            # Page loads are network-bound, so categories scrape in parallel;
+            # each worker thread reuses its own driver
+            futures = {
+                self._pool.submit(self._scrape_one, category, url): category
+                for category, url in self.urls.items()
+            }
+            for future in as_completed(futures):
+                all_prices.extend(future.result())
+
         except Exception as e:
             logger.error(f"Selenium setup error: {e}")
             # Return fallback data if scraping fails
@@ -1,9 +1,15 @@
 """Pydantic models for request/response validation."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+# Response models are frozen and ignore extras: server-side data is already
+# trusted, so pydantic-core can take its fast path, and hot handlers can
+# build instances with Model.model_construct(...) to skip revalidation
+# entirely.
+_RESPONSE_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
 class WeatherRequest(BaseModel):
     """Request model for weather data."""
     lat: Optional[float] = Field(None, description="Latitude coordinate")
@@ -12,6 +18,8 @@ class WeatherRequest(BaseModel):
 
 class WeatherResponse(BaseModel):
     """Response model for weather data."""
+    model_config = _RESPONSE_CONFIG
+
     city: str
     temperature: float
     description: str
@@ -25,10 +33,14 @@ class VoiceQueryRequest(BaseModel):
 
 class VoiceQueryResponse(BaseModel):
     """Response model for voice queries."""
+    model_config = _RESPONSE_CONFIG
+
     response: str = Field(..., description="AI assistant response")
 
 class PredictionResponse(BaseModel):
     """Response model for disease predictions."""
+    model_config = _RESPONSE_CONFIG
+
     disease: str = Field(..., description="Detected disease class")
     confidence: float = Field(..., description="Prediction confidence percentage")
     treatment: str = Field(..., description="Treatment recommendation")
@@ -36,12 +48,16 @@ class PredictionResponse(BaseModel):
 
 class MarketPriceItem(BaseModel):
     """Model for individual market price item."""
+    model_config = _RESPONSE_CONFIG
+
     category: str = Field(..., description="Product category (Vegetable/Fruit)")
     name: str = Field(..., description="Product name")
     price: str = Field(..., description="Price range or value")
 
 class HistoryItem(BaseModel):
     """Base model for history items."""
+    model_config = _RESPONSE_CONFIG
+
     timestamp: datetime
 
 class PredictionHistory(HistoryItem):
@@ -58,6 +74,8 @@ class WeatherHistory(HistoryItem):
 
 class AppStats(BaseModel):
     """Model for application statistics."""
+    model_config = _RESPONSE_CONFIG
+
     total_predictions: int
     weather_queries: int
     voice_queries: int
@@ -65,8 +83,8 @@ class AppStats(BaseModel):
 
 class HealthResponse(BaseModel):
     """Model for health check response."""
-    model_config = {"protected_namespaces": ()}
-    
+    model_config = ConfigDict(frozen=True, extra="ignore", protected_namespaces=())
+
     status: str
     timestamp: datetime
     model_loaded: bool
@@ -74,9 +92,9 @@ class HealthResponse(BaseModel):
 
 class APIInfo(BaseModel):
     """Model for API information."""
-    model_config = {"protected_namespaces": ()}
-    
+    model_config = ConfigDict(frozen=True, extra="ignore", protected_namespaces=())
+
     message: str
     version: str
     features: List[str]
-    health: Dict[str, bool]
\ No newline at end of file
+    health: Dict[str, bool]
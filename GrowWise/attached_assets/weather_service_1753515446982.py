@@ -2,8 +2,12 @@
 
 import requests
 import logging
+from threading import Lock
 from typing import Dict, Optional
+from cachetools import TTLCache
 from fastapi import HTTPException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import settings
 
@@ -11,11 +15,23 @@ logger = logging.getLogger(__name__)
 
 class WeatherService:
     """Service for fetching weather data from OpenWeatherMap API."""
-    
+
     def __init__(self):
         self.api_key = settings.OPENWEATHER_API_KEY
         self.base_url = "https://api.openweathermap.org/data/2.5/weather"
-    
+        # Upstream refreshes roughly every 10 minutes; repeat queries for the
+        # same place within that window share one API call
+        self._cache = TTLCache(maxsize=512, ttl=600)
+        self._lock = Lock()
+        # Shared session: keep-alive connections amortize the TCP+TLS
+        # handshake across calls instead of paying it per request
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        ))
+
     def get_weather_data(
         self, 
         city: Optional[str] = None, 
@@ -37,16 +53,19 @@ class WeatherService:
             HTTPException: If API request fails or data is invalid
         """
         if lat is not None and lon is not None:
+            # Round coordinates so nearby GPS fixes share a cache entry
+            cache_key = (round(lat, 2), round(lon, 2))
             params = {
-                'lat': lat, 
-                'lon': lon, 
-                'appid': self.api_key, 
+                'lat': lat,
+                'lon': lon,
+                'appid': self.api_key,
                 'units': 'metric'
             }
         elif city:
+            cache_key = city.strip().lower()
             params = {
-                'q': city, 
-                'appid': self.api_key, 
+                'q': city,
+                'appid': self.api_key,
                 'units': 'metric'
             }
         else:
@@ -55,12 +74,17 @@ class WeatherService:
                 detail="Either city name or coordinates are required"
             )
 
+        with self._lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = self.session.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
-            return {
+            weather = {
                 'city': data['name'],
                 'temperature': data['main']['temp'],
                 'description': data['weather'][0]['description'].title(),
@@ -68,7 +92,14 @@ class WeatherService:
                 'wind_speed': data['wind']['speed'],
                 'country': data['sys']['country']
             }
-            
+
+            # Only successful lookups are cached; errors keep their
+            # HTTPException semantics and retry upstream next call
+            with self._lock:
+                self._cache[cache_key] = weather
+
+            return weather
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Weather API request error: {e}")
             raise HTTPException(
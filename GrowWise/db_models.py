@@ -1,19 +1,29 @@
 """Database models for GrowWise application."""
 
+import atexit
+import logging
+import queue
+import signal
+import sys
+import threading
+import time
 from datetime import datetime
+from sqlalchemy import select
 from extensions import db
 
+logger = logging.getLogger(__name__)
+
 
 class Prediction(db.Model):
     """Model for storing plant disease predictions."""
     __tablename__ = 'predictions'
     
     id = db.Column(db.Integer, primary_key=True)
-    disease = db.Column(db.String(200), nullable=False)
+    disease = db.Column(db.String(200), nullable=False, index=True)
     confidence = db.Column(db.Float, nullable=False)
     treatment = db.Column(db.Text, nullable=True)
     formatted_name = db.Column(db.String(200), nullable=True)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
     
     def to_dict(self):
         """Convert model to dictionary."""
@@ -37,7 +47,7 @@ class WeatherQuery(db.Model):
     description = db.Column(db.String(200), nullable=True)
     humidity = db.Column(db.Integer, nullable=True)
     wind_speed = db.Column(db.Float, nullable=True)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
     
     def to_dict(self):
         """Convert model to dictionary."""
@@ -59,7 +69,7 @@ class VoiceQuery(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     query = db.Column(db.Text, nullable=False)
     response = db.Column(db.Text, nullable=False)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
     
     def to_dict(self):
         """Convert model to dictionary."""
@@ -78,7 +88,7 @@ class MarketPrice(db.Model):
     category = db.Column(db.String(50), nullable=False)  # 'Vegetable' or 'Fruit'
     name = db.Column(db.String(100), nullable=False)
     price = db.Column(db.String(50), nullable=False)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
     
     def to_dict(self):
         """Convert model to dictionary."""
@@ -92,9 +102,123 @@ class MarketPrice(db.Model):
 
 class DatabaseManager:
     """Database manager class for handling operations."""
-    
+
+    # Stats are not real-time critical; serve them from cache briefly instead
+    # of running three COUNTs and a GROUP BY per dashboard hit
+    STATS_TTL_SECONDS = 30
+
+    # History writes are funneled through a bounded queue drained by one
+    # background thread, so many requests share a single commit (one fsync
+    # per batch instead of one per request)
+    WRITE_QUEUE_MAX = 1000
+    WRITE_BATCH_MAX = 100
+    WRITE_FLUSH_SECONDS = 0.25
+
+    _WRITE_TABLES = {
+        'prediction': Prediction.__table__,
+        'weather': WeatherQuery.__table__,
+        'voice': VoiceQuery.__table__,
+    }
+
+    def __init__(self):
+        self._stats_cache = None
+        self._stats_cached_at = 0.0
+        self._write_queue = queue.Queue(maxsize=self.WRITE_QUEUE_MAX)
+        self._writer_app = None
+        self._writer_thread = None
+
+    def start_writer(self, app):
+        """Start the background writer thread for batched history inserts."""
+        if self._writer_thread is not None:
+            return
+        self._writer_app = app
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name='db-writer', daemon=True
+        )
+        self._writer_thread.start()
+        # The writer is a daemon thread, so anything still queued when the
+        # process exits would be dropped silently. Drain the queue inline at
+        # interpreter exit, and turn a bare SIGTERM (plain `python app.py`,
+        # serverless teardown) into a normal exit so atexit actually runs.
+        # Servers that install their own SIGTERM handling (gunicorn) are
+        # left alone — their graceful worker exit reaches atexit already.
+        atexit.register(self._drain_writes)
+        if threading.current_thread() is threading.main_thread() and \
+                signal.getsignal(signal.SIGTERM) == signal.SIG_DFL:
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    def _drain_writes(self):
+        """Flush every row still queued; runs inline at process exit."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._write_queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._flush_batch(batch)
+
+    def _enqueue(self, kind: str, row: dict) -> bool:
+        """Queue a row for the writer; False means the caller must write inline."""
+        if self._writer_thread is None:
+            return False
+        try:
+            self._write_queue.put_nowait((kind, row))
+            return True
+        except queue.Full:
+            return False
+
+    def _writer_loop(self):
+        """Drain the write queue, grouping rows into one commit per batch."""
+        while True:
+            batch = [self._write_queue.get()]
+            deadline = time.time() + self.WRITE_FLUSH_SECONDS
+            while len(batch) < self.WRITE_BATCH_MAX:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush_batch(batch)
+
+    def _flush_batch(self, batch: list):
+        """Insert a batch of queued rows inside a single transaction."""
+        grouped = {}
+        for kind, row in batch:
+            grouped.setdefault(kind, []).append(row)
+        with self._writer_app.app_context():
+            try:
+                for kind, rows in grouped.items():
+                    db.session.execute(self._WRITE_TABLES[kind].insert(), rows)
+                db.session.commit()
+                self._invalidate_stats()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Background write flush failed: {e}")
+
+    def _invalidate_stats(self):
+        """Drop the cached stats after a write that affects them."""
+        self._stats_cache = None
+
     def save_prediction(self, disease: str, confidence: float, treatment: str, formatted_name: str = None):
-        """Save disease prediction to database."""
+        """Save disease prediction to database.
+
+        While the background writer is running the row is queued and
+        committed asynchronously: this returns before the write lands, a
+        failed flush is logged instead of raised to the caller, and rows
+        still queued at process exit are drained inline by _drain_writes.
+        Without the writer (or with the queue full) the write happens
+        inline and failures raise as before.
+        """
+        if self._enqueue('prediction', {
+            'disease': disease,
+            'confidence': confidence,
+            'treatment': treatment,
+            'formatted_name': formatted_name
+        }):
+            return
         try:
             prediction = Prediction(
                 disease=disease,
@@ -104,12 +228,26 @@ class DatabaseManager:
             )
             db.session.add(prediction)
             db.session.commit()
+            self._invalidate_stats()
         except Exception as e:
             db.session.rollback()
             raise e
     
     def save_weather_data(self, weather_data: dict):
-        """Save weather data to database."""
+        """Save weather data to database.
+
+        Same durability contract as save_prediction: asynchronous and
+        non-raising via the writer queue, inline and raising otherwise.
+        """
+        if self._enqueue('weather', {
+            'city': weather_data['city'],
+            'country': weather_data.get('country'),
+            'temperature': weather_data['temperature'],
+            'description': weather_data.get('description'),
+            'humidity': weather_data.get('humidity'),
+            'wind_speed': weather_data.get('wind_speed')
+        }):
+            return
         try:
             weather_query = WeatherQuery(
                 city=weather_data['city'],
@@ -121,12 +259,19 @@ class DatabaseManager:
             )
             db.session.add(weather_query)
             db.session.commit()
+            self._invalidate_stats()
         except Exception as e:
             db.session.rollback()
             raise e
     
     def save_voice_query(self, query: str, response: str):
-        """Save voice query and response to database."""
+        """Save voice query and response to database.
+
+        Same durability contract as save_prediction: asynchronous and
+        non-raising via the writer queue, inline and raising otherwise.
+        """
+        if self._enqueue('voice', {'query': query, 'response': response}):
+            return
         try:
             voice_query = VoiceQuery(
                 query=query,
@@ -134,6 +279,7 @@ class DatabaseManager:
             )
             db.session.add(voice_query)
             db.session.commit()
+            self._invalidate_stats()
         except Exception as e:
             db.session.rollback()
             raise e
@@ -144,39 +290,59 @@ class DatabaseManager:
             # Clear old prices (older than 1 day)
             from datetime import timedelta
             cutoff_date = datetime.utcnow() - timedelta(days=1)
-            MarketPrice.query.filter(MarketPrice.timestamp < cutoff_date).delete()
-            
-            # Add new prices
-            for price_data in prices:
-                market_price = MarketPrice(
-                    category=price_data['category'],
-                    name=price_data['name'],
-                    price=price_data['price']
+            MarketPrice.query.filter(MarketPrice.timestamp < cutoff_date).delete(synchronize_session=False)
+
+            # Insert the whole batch in one multi-row statement, skipping
+            # per-object ORM instrumentation
+            if prices:
+                db.session.execute(
+                    MarketPrice.__table__.insert(),
+                    [
+                        {
+                            'category': price_data['category'],
+                            'name': price_data['name'],
+                            'price': price_data['price']
+                        }
+                        for price_data in prices
+                    ]
                 )
-                db.session.add(market_price)
-            
+
             db.session.commit()
         except Exception as e:
             db.session.rollback()
             raise e
     
+    @staticmethod
+    def _history_rows(model, limit: int) -> list:
+        """Fetch the newest rows of a model as plain dicts.
+
+        Uses a Core column projection instead of materializing ORM objects,
+        so rows skip attribute instrumentation and per-object to_dict calls.
+        """
+        columns = [column for column in model.__table__.columns]
+        rows = db.session.execute(
+            select(*columns).order_by(model.timestamp.desc()).limit(limit)
+        ).mappings()
+        return [{**row, 'timestamp': row['timestamp'].isoformat()} for row in rows]
+
     def get_prediction_history(self, limit: int = 10) -> list:
         """Get recent disease prediction history."""
-        predictions = Prediction.query.order_by(Prediction.timestamp.desc()).limit(limit).all()
-        return [pred.to_dict() for pred in predictions]
-    
+        return self._history_rows(Prediction, limit)
+
     def get_weather_history(self, limit: int = 10) -> list:
         """Get recent weather queries."""
-        weather_queries = WeatherQuery.query.order_by(WeatherQuery.timestamp.desc()).limit(limit).all()
-        return [query.to_dict() for query in weather_queries]
-    
+        return self._history_rows(WeatherQuery, limit)
+
     def get_voice_history(self, limit: int = 10) -> list:
         """Get recent voice queries."""
-        voice_queries = VoiceQuery.query.order_by(VoiceQuery.timestamp.desc()).limit(limit).all()
-        return [query.to_dict() for query in voice_queries]
+        return self._history_rows(VoiceQuery, limit)
     
     def get_app_stats(self) -> dict:
         """Get application usage statistics."""
+        now = time.time()
+        if self._stats_cache is not None and now - self._stats_cached_at < self.STATS_TTL_SECONDS:
+            return self._stats_cache
+
         try:
             total_predictions = Prediction.query.count()
             weather_queries = WeatherQuery.query.count()
@@ -195,13 +361,16 @@ class DatabaseManager:
                 {'disease': disease, 'count': count}
                 for disease, count in common_diseases
             ]
-            
-            return {
+
+            stats = {
                 'total_predictions': total_predictions,
                 'weather_queries': weather_queries,
                 'voice_queries': voice_queries,
                 'common_diseases': common_diseases_list
             }
+            self._stats_cache = stats
+            self._stats_cached_at = now
+            return stats
         except Exception as e:
             return {
                 'total_predictions': 0,
@@ -1,125 +1,150 @@
 """Data models for GrowWise application."""
 
-import json
 import os
+from collections import Counter, deque
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
+
+import orjson
 
 class DataManager:
-    """Manages JSON-based data storage for serverless deployment."""
-    
+    """Manages NDJSON-based data storage for serverless deployment.
+
+    History files are append-only NDJSON logs: each save is a single O(1)
+    append instead of a load-modify-rewrite of the whole file. Logs are
+    trimmed back to their retention limit periodically rather than on every
+    write.
+    """
+
+    # Retention limits per log file
+    MAX_RECORDS = {
+        "predictions.ndjson": 100,
+        "weather_cache.ndjson": 50,
+        "voice_queries.ndjson": 100,
+    }
+
     def __init__(self):
         self.data_dir = "data"
+        self._appends_since_trim = {}
         self.ensure_data_files()
-    
+
     def ensure_data_files(self):
-        """Ensure all required JSON files exist."""
-        files = {
-            "predictions.json": [],
-            "weather_cache.json": [],
-            "voice_queries.json": [],
-            "market_prices.json": []
-        }
-        
-        for filename, default_data in files.items():
+        """Ensure all required data files exist, migrating legacy JSON lists."""
+        os.makedirs(self.data_dir, exist_ok=True)
+
+        for filename in self.MAX_RECORDS:
             filepath = os.path.join(self.data_dir, filename)
             if not os.path.exists(filepath):
-                self.save_json(filepath, default_data)
-    
-    def load_json(self, filepath: str) -> List[Dict]:
-        """Load data from JSON file."""
+                self._migrate_legacy_json(filepath)
+
+        # market_prices.json keeps its plain-JSON list format (owned by the
+        # market service, not an append-only log)
+        market_file = os.path.join(self.data_dir, "market_prices.json")
+        if not os.path.exists(market_file):
+            with open(market_file, 'wb') as f:
+                f.write(orjson.dumps([]))
+
+    def _migrate_legacy_json(self, ndjson_path: str):
+        """Create an NDJSON log, converting a legacy .json list if present."""
+        legacy_path = ndjson_path[:-len('.ndjson')] + '.json'
+        records = []
+        if os.path.exists(legacy_path):
+            try:
+                with open(legacy_path, 'rb') as f:
+                    records = orjson.loads(f.read())
+            except (orjson.JSONDecodeError, OSError):
+                records = []
+
+        with open(ndjson_path, 'wb') as f:
+            for record in records:
+                f.write(orjson.dumps(record, default=str) + b'\n')
+
+    def load_records(self, filepath: str) -> List[Dict]:
+        """Load all records from an NDJSON file."""
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(filepath, 'rb') as f:
+                return [orjson.loads(line) for line in f if line.strip()]
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return []
-    
-    def save_json(self, filepath: str, data: List[Dict]):
-        """Save data to JSON file."""
+
+    def append_record(self, filename: str, record: Dict):
+        """Append one record to an NDJSON log, trimming it periodically."""
+        filepath = os.path.join(self.data_dir, filename)
         try:
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(filepath, 'ab') as f:
+                f.write(orjson.dumps(record, default=str) + b'\n')
         except Exception as e:
             print(f"Error saving to {filepath}: {e}")
-    
+            return
+
+        # Rewrite the log only after a full retention window of appends,
+        # keeping the hot path append-only
+        max_records = self.MAX_RECORDS[filename]
+        count = self._appends_since_trim.get(filename, 0) + 1
+        if count >= max_records:
+            self._trim(filepath, max_records)
+            count = 0
+        self._appends_since_trim[filename] = count
+
+    def _trim(self, filepath: str, max_records: int):
+        """Rewrite a log keeping only the newest records."""
+        try:
+            with open(filepath, 'rb') as f:
+                lines = deque(f, maxlen=max_records)
+            with open(filepath, 'wb') as f:
+                f.writelines(lines)
+        except Exception as e:
+            print(f"Error trimming {filepath}: {e}")
+
     def save_prediction(self, disease: str, confidence: float, treatment: str):
         """Save disease prediction."""
-        filepath = os.path.join(self.data_dir, "predictions.json")
-        predictions = self.load_json(filepath)
-        
-        prediction = {
+        self.append_record("predictions.ndjson", {
             "disease": disease,
             "confidence": confidence,
             "treatment": treatment,
             "timestamp": datetime.now().isoformat()
-        }
-        
-        predictions.append(prediction)
-        # Keep only last 100 predictions
-        predictions = predictions[-100:]
-        self.save_json(filepath, predictions)
-    
+        })
+
     def save_weather_data(self, weather_data: Dict[str, Any]):
         """Save weather data."""
-        filepath = os.path.join(self.data_dir, "weather_cache.json")
-        cache = self.load_json(filepath)
-        
-        weather_entry = {
+        self.append_record("weather_cache.ndjson", {
             **weather_data,
             "timestamp": datetime.now().isoformat()
-        }
-        
-        cache.append(weather_entry)
-        # Keep only last 50 weather queries
-        cache = cache[-50:]
-        self.save_json(filepath, cache)
-    
+        })
+
     def save_voice_query(self, query: str, response: str):
         """Save voice query and response."""
-        filepath = os.path.join(self.data_dir, "voice_queries.json")
-        queries = self.load_json(filepath)
-        
-        query_entry = {
+        self.append_record("voice_queries.ndjson", {
             "query": query,
             "response": response,
             "timestamp": datetime.now().isoformat()
-        }
-        
-        queries.append(query_entry)
-        # Keep only last 100 queries
-        queries = queries[-100:]
-        self.save_json(filepath, queries)
-    
+        })
+
     def get_prediction_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent prediction history."""
-        filepath = os.path.join(self.data_dir, "predictions.json")
-        predictions = self.load_json(filepath)
+        filepath = os.path.join(self.data_dir, "predictions.ndjson")
+        predictions = self.load_records(filepath)
         return predictions[-limit:][::-1]  # Return latest first
-    
+
     def get_weather_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent weather queries."""
-        filepath = os.path.join(self.data_dir, "weather_cache.json")
-        cache = self.load_json(filepath)
+        filepath = os.path.join(self.data_dir, "weather_cache.ndjson")
+        cache = self.load_records(filepath)
         return cache[-limit:][::-1]  # Return latest first
-    
+
     def get_app_stats(self) -> Dict[str, Any]:
         """Get application usage statistics."""
-        predictions = self.load_json(os.path.join(self.data_dir, "predictions.json"))
-        weather_cache = self.load_json(os.path.join(self.data_dir, "weather_cache.json"))
-        voice_queries = self.load_json(os.path.join(self.data_dir, "voice_queries.json"))
-        
-        # Count diseases
-        disease_counts = {}
-        for pred in predictions:
-            disease = pred.get("disease", "Unknown")
-            disease_counts[disease] = disease_counts.get(disease, 0) + 1
-        
+        predictions = self.load_records(os.path.join(self.data_dir, "predictions.ndjson"))
+        weather_cache = self.load_records(os.path.join(self.data_dir, "weather_cache.ndjson"))
+        voice_queries = self.load_records(os.path.join(self.data_dir, "voice_queries.ndjson"))
+
+        # Count diseases in C with a bounded partial sort for the top 5
+        disease_counts = Counter(pred.get("disease", "Unknown") for pred in predictions)
         common_diseases = [
             {"disease": disease, "count": count}
-            for disease, count in sorted(disease_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+            for disease, count in disease_counts.most_common(5)
         ]
-        
+
         return {
             "total_predictions": len(predictions),
             "weather_queries": len(weather_cache),
@@ -127,5 +152,10 @@ class DataManager:
             "common_diseases": common_diseases
         }
 
-# Global data manager instance (legacy)
-data_manager = DataManager()
\ No newline at end of file
+# Global data manager instance (legacy). Only instantiated when the JSON
+# backend is explicitly requested, so merely importing this module no longer
+# scans and creates data files in every worker.
+if os.environ.get('GROWWISE_BACKEND') == 'json':
+    data_manager = DataManager()
+else:
+    data_manager = None
@@ -18,14 +18,16 @@ main_bp = Blueprint('main', __name__)
 
 UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
+_ALLOWED_SUFFIXES = tuple('.' + ext for ext in ALLOWED_EXTENSIONS)
 
 # Ensure upload directory exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 def allowed_file(filename):
     """Check if file extension is allowed."""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    # endswith against a tuple is a single short-circuiting C-level scan,
+    # with no intermediate list/string allocations from rsplit
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
 
 @main_bp.route('/')
 def index():
@@ -79,30 +81,29 @@ def detect_disease():
                 'error': 'No image file provided'
             }), 400
         
-        file = request.files['image']
-        if file.filename == '':
+        files = request.files.getlist('image')
+        if not files or all(f.filename == '' for f in files):
             return jsonify({
                 'success': False,
                 'error': 'No file selected'
             }), 400
-        
-        if file and allowed_file(file.filename):
-            # Read image data
-            image_data = file.read()
-            
-            # Analyze image
-            result = disease_service.analyze_image(image_data)
-            
-            # Save prediction
-            db_manager.save_prediction(
-                result['disease'],
-                result['confidence'],
-                result['treatment']
-            )
-            
+
+        if all(f and allowed_file(f.filename) for f in files):
+            # Hand the upload streams to PIL directly instead of materializing
+            # each image as a bytes object first
+            results = disease_service.analyze_images([f.stream for f in files])
+
+            # Save predictions
+            for result in results:
+                db_manager.save_prediction(
+                    result['disease'],
+                    result['confidence'],
+                    result['treatment']
+                )
+
             return jsonify({
                 'success': True,
-                'data': result
+                'data': results[0] if len(results) == 1 else results
             })
         else:
             return jsonify({
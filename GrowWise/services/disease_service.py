@@ -1,60 +1,130 @@
 """Disease detection service using basic image analysis."""
 
 import logging
-from PIL import Image, ImageStat
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from PIL import Image
 import io
-from typing import Dict
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Mapping
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# Decoded images at least this large go straight to the JIT kernel at full
+# resolution; smaller ones are cheaper to shrink and histogram instead
+_NUMBA_MIN_PIXELS = 1 << 16
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _mean_rgb_sums(arr):
+        """Single-pass parallel RGB sum over a HxWx3 uint8 array."""
+        sum_r = 0
+        sum_g = 0
+        sum_b = 0
+        for i in prange(arr.shape[0]):
+            for j in range(arr.shape[1]):
+                sum_r += arr[i, j, 0]
+                sum_g += arr[i, j, 1]
+                sum_b += arr[i, j, 2]
+        return sum_r, sum_g, sum_b
+else:
+    _mean_rgb_sums = None
+
 class DiseaseDetectionService:
     """Service for basic plant analysis and disease detection."""
     
-    def __init__(self):
-        # Basic disease patterns based on image characteristics
-        self.disease_patterns = {
-            'brown_spots': {
-                'name': 'Possible Brown Spot Disease',
-                'treatment': 'Apply copper-based fungicide spray. Remove affected leaves and improve air circulation.'
-            },
-            'yellow_leaves': {
-                'name': 'Possible Yellowing/Chlorosis',
-                'treatment': 'Check for nutrient deficiency (nitrogen). Ensure proper watering and fertilization.'
-            },
-            'dark_patches': {
-                'name': 'Possible Blight or Bacterial Infection',
-                'treatment': 'Remove infected parts immediately. Apply bactericide and ensure good drainage.'
-            },
-            'white_patches': {
-                'name': 'Possible Powdery Mildew',
-                'treatment': 'Improve air circulation. Apply fungicide spray and avoid overhead watering.'
-            },
-            'healthy': {
-                'name': 'Plant Appears Healthy',
-                'treatment': 'Continue with regular care and monitoring. Maintain proper watering and fertilization.'
-            }
+    # Basic disease patterns based on image characteristics; class-level and
+    # read-only so every instance shares one copy of the pattern strings
+    disease_patterns: ClassVar[Mapping[str, Dict[str, str]]] = MappingProxyType({
+        'brown_spots': {
+            'name': 'Possible Brown Spot Disease',
+            'treatment': 'Apply copper-based fungicide spray. Remove affected leaves and improve air circulation.'
+        },
+        'yellow_leaves': {
+            'name': 'Possible Yellowing/Chlorosis',
+            'treatment': 'Check for nutrient deficiency (nitrogen). Ensure proper watering and fertilization.'
+        },
+        'dark_patches': {
+            'name': 'Possible Blight or Bacterial Infection',
+            'treatment': 'Remove infected parts immediately. Apply bactericide and ensure good drainage.'
+        },
+        'white_patches': {
+            'name': 'Possible Powdery Mildew',
+            'treatment': 'Improve air circulation. Apply fungicide spray and avoid overhead watering.'
+        },
+        'healthy': {
+            'name': 'Plant Appears Healthy',
+            'treatment': 'Continue with regular care and monitoring. Maintain proper watering and fertilization.'
         }
+    })
+
+    def __init__(self):
+        # PIL releases the GIL around JPEG/PNG decode, so images in a batch
+        # can decode concurrently across cores
+        self._pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
     
-    def analyze_image(self, image_data: bytes) -> Dict[str, any]:
+    def analyze_image(self, image_data) -> Dict[str, any]:
         """
         Analyze plant image using basic color and pattern analysis.
-        
+
         Args:
-            image_data: Raw image data
-            
+            image_data: Raw image data or a readable binary file object
+
         Returns:
             Dictionary containing analysis results
         """
         try:
-            # Load and analyze image
-            image = Image.open(io.BytesIO(image_data)).convert('RGB')
-            
-            # Basic image analysis
-            stats = ImageStat.Stat(image)
-            avg_r, avg_g, avg_b = stats.mean
-            
+            # Load and analyze image; PIL reads file objects incrementally,
+            # so uploads don't need to be materialized as bytes first
+            if hasattr(image_data, 'read'):
+                source = image_data
+                if hasattr(source, 'seek'):
+                    source.seek(0)
+            else:
+                source = io.BytesIO(image_data)
+
+            # Cheap header validation first: verify() parses format metadata
+            # without decoding pixels, so garbage uploads are rejected in
+            # microseconds instead of after a full decode. It consumes the
+            # handle, so rewind and reopen for the real decode.
+            if hasattr(source, 'seek'):
+                Image.open(source).verify()
+                source.seek(0)
+            image = Image.open(source)
+
+            # Let libjpeg decode JPEGs at reduced scale via IDCT scaling;
+            # the heuristic only uses channel means, so the sub-sampled
+            # decode loses nothing. No-op for other formats.
+            image.draft('RGB', (256, 256))
+            image = image.convert('RGB')
+
+            pixel_count = image.width * image.height
+            if _mean_rgb_sums is not None and pixel_count >= _NUMBA_MIN_PIXELS:
+                # Large decode with numba available: one parallel pass over
+                # the full-resolution pixels beats resampling them first
+                arr = np.asarray(image, dtype=np.uint8)
+                sum_r, sum_g, sum_b = _mean_rgb_sums(arr)
+            else:
+                # Mean color is scale-invariant, so shrink the image to a
+                # small tile (fast C box filter); one C-level pass then
+                # builds the per-channel histograms, and channel sums are a
+                # 256-term dot product with the bin indices — no pixel
+                # ndarray materialized
+                image.thumbnail((128, 128), Image.Resampling.BOX)
+                pixel_count = image.width * image.height
+                hist = image.histogram()
+                sum_r = sum(i * count for i, count in enumerate(hist[0:256]))
+                sum_g = sum(i * count for i, count in enumerate(hist[256:512]))
+                sum_b = sum(i * count for i, count in enumerate(hist[512:768]))
+
             # Simple heuristic-based analysis
-            disease_type, confidence = self._analyze_colors(avg_r, avg_g, avg_b)
+            disease_type, confidence = self._analyze_colors(sum_r, sum_g, sum_b, pixel_count)
             
             disease_info = self.disease_patterns[disease_type]
             
@@ -74,32 +144,48 @@ class DiseaseDetectionService:
                 'formatted_name': 'Analysis Error'
             }
     
-    def _analyze_colors(self, avg_r: float, avg_g: float, avg_b: float) -> tuple:
+    def analyze_images(self, images: List) -> List[Dict[str, any]]:
         """
-        Analyze average colors to determine possible plant condition.
-        
+        Analyze a batch of plant images in a single call.
+
         Args:
-            avg_r: Average red value
-            avg_g: Average green value
-            avg_b: Average blue value
-            
+            images: List of raw image data blobs or readable file objects
+
+        Returns:
+            List of analysis result dictionaries, one per image
+        """
+        if len(images) <= 1:
+            return [self.analyze_image(image_data) for image_data in images]
+        return list(self._pool.map(self.analyze_image, images))
+
+    def _analyze_colors(self, sum_r: int, sum_g: int, sum_b: int, pixel_count: int) -> tuple:
+        """
+        Analyze channel sums to determine possible plant condition.
+
+        Args:
+            sum_r: Total red value over all pixels
+            sum_g: Total green value over all pixels
+            sum_b: Total blue value over all pixels
+            pixel_count: Number of pixels summed
+
         Returns:
             Tuple of (disease_type, confidence)
         """
-        # Simple color-based heuristics
-        green_ratio = avg_g / (avg_r + avg_g + avg_b)
-        red_ratio = avg_r / (avg_r + avg_g + avg_b)
-        
+        # Integer-only rewrites of the original ratio/average thresholds
+        # (e.g. g/total > 0.4 becomes 5*g > 2*total), avoiding FP division
+        # and rounding differences across platforms
+        total = sum_r + sum_g + sum_b
+
         # Determine condition based on color ratios
-        if green_ratio > 0.4 and avg_g > avg_r and avg_g > avg_b:
+        if 5 * sum_g > 2 * total and sum_g > sum_r and sum_g > sum_b:
             return 'healthy', 85.0
-        elif red_ratio > 0.35 and avg_r > avg_g:
+        elif 20 * sum_r > 7 * total and sum_r > sum_g:
             return 'brown_spots', 75.0
-        elif avg_r > 150 and avg_g > 150 and avg_b < 100:
+        elif sum_r > 150 * pixel_count and sum_g > 150 * pixel_count and sum_b < 100 * pixel_count:
             return 'yellow_leaves', 70.0
-        elif avg_r < 100 and avg_g < 100 and avg_b < 100:
+        elif sum_r < 100 * pixel_count and sum_g < 100 * pixel_count and sum_b < 100 * pixel_count:
             return 'dark_patches', 65.0
-        elif avg_r > 200 and avg_g > 200 and avg_b > 200:
+        elif sum_r > 200 * pixel_count and sum_g > 200 * pixel_count and sum_b > 200 * pixel_count:
             return 'white_patches', 60.0
         else:
             return 'healthy', 50.0
@@ -1,17 +1,29 @@
 """Market price service with cached data."""
 
-import json
+import orjson
 import os
 import logging
 from typing import List, Dict
 
 logger = logging.getLogger(__name__)
 
+# Built once at import so the error path returns a shared precomputed list
+# instead of constructing the row dicts on every failed call
+FALLBACK_PRICES = [
+    {'category': 'Vegetable', 'name': 'Onion', 'price': '₹30-40/kg'},
+    {'category': 'Vegetable', 'name': 'Tomato', 'price': '₹25-35/kg'},
+    {'category': 'Fruit', 'name': 'Apple', 'price': '₹120-150/kg'},
+    {'category': 'Fruit', 'name': 'Banana', 'price': '₹40-50/dozen'}
+]
+
 class MarketPriceService:
     """Service for providing market price data."""
     
     def __init__(self):
         self.cache_file = "data/market_prices.json"
+        self._prices_cache = None
+        self._by_category = {}
+        self._cache_mtime = None
         self._initialize_prices()
     
     def _initialize_prices(self):
@@ -43,40 +55,45 @@ class MarketPriceService:
         if not os.path.exists(self.cache_file):
             os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
             try:
-                with open(self.cache_file, 'w') as f:
-                    json.dump(default_prices, f, indent=2)
+                with open(self.cache_file, 'wb') as f:
+                    f.write(orjson.dumps(default_prices, option=orjson.OPT_INDENT_2))
                 logger.info("Market prices cache initialized")
             except Exception as e:
                 logger.error(f"Error initializing market prices: {e}")
     
+    def _load_prices(self) -> List[Dict[str, str]]:
+        """Return the parsed price list, re-reading only when the file changes."""
+        mtime = os.path.getmtime(self.cache_file)
+        if self._prices_cache is None or mtime != self._cache_mtime:
+            with open(self.cache_file, 'rb') as f:
+                self._prices_cache = orjson.loads(f.read())
+            # Partition once per reload so category requests are a dict
+            # lookup instead of a filter scan with .lower() per row
+            by_category = {'all': self._prices_cache}
+            for price in self._prices_cache:
+                by_category.setdefault(price['category'].lower(), []).append(price)
+            self._by_category = by_category
+            self._cache_mtime = mtime
+        return self._prices_cache
+
     def get_market_prices(self, category: str = 'all') -> List[Dict[str, str]]:
         """
         Get market prices, optionally filtered by category.
-        
+
         Args:
             category: Filter by category ('Vegetable', 'Fruit', or 'all')
-            
+
         Returns:
             List of price dictionaries
         """
         try:
-            with open(self.cache_file, 'r') as f:
-                prices = json.load(f)
-            
-            if category.lower() == 'all':
-                return prices
-            else:
-                return [p for p in prices if p['category'].lower() == category.lower()]
-                
+            self._load_prices()
+            return self._by_category.get(category.lower(), [])
+
         except Exception as e:
             logger.error(f"Error loading market prices: {e}")
             # Return fallback data
-            return [
-                {'category': 'Vegetable', 'name': 'Onion', 'price': '₹30-40/kg'},
-                {'category': 'Vegetable', 'name': 'Tomato', 'price': '₹25-35/kg'},
-                {'category': 'Fruit', 'name': 'Apple', 'price': '₹120-150/kg'},
-                {'category': 'Fruit', 'name': 'Banana', 'price': '₹40-50/dozen'}
-            ]
+            return FALLBACK_PRICES
 
 # Global market service instance
 market_service = MarketPriceService()
@@ -1,15 +1,26 @@
 """Voice query processing service."""
 
 import logging
-from typing import Dict, List
+import re
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Mapping
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
 class VoiceAssistantService:
     """Service for processing voice queries and generating responses."""
     
-    def __init__(self):
-        self.query_patterns = {
+    # Class-level frozen mappings: the pattern and response data is immutable,
+    # so all instances share one copy. Greetings are listed first so they win
+    # ties in the category scan, matching the old short-circuit behavior
+    query_patterns: ClassVar[Mapping[str, List[str]]] = MappingProxyType({
+            'greeting': ['hello', 'hi', 'hey', 'good morning', 'good afternoon',
+                         'good evening', 'namaste', 'greetings', 'howdy'],
             'weather': ['weather', 'temperature', 'rain', 'climate', 'forecast', 'sunny', 'cloudy', 'humidity'],
             'prices': ['price', 'cost', 'market', 'sell', 'buy', 'rate', 'expensive', 'cheap', 'rupees'],
             'disease': ['disease', 'sick', 'problem', 'leaf', 'plant', 'crop', 'infection', 'pest', 'spots', 'yellow'],
@@ -18,9 +29,9 @@ class VoiceAssistantService:
             'pest': ['pest', 'insect', 'bug', 'caterpillar', 'aphid', 'mite', 'larvae'],
             'soil': ['soil', 'ph', 'acidity', 'alkaline', 'drainage', 'clay', 'sand', 'loam'],
             'season': ['season', 'monsoon', 'winter', 'summer', 'sowing', 'timing']
-        }
-        
-        self.responses = {
+    })
+
+    responses: ClassVar[Mapping[str, str]] = MappingProxyType({
             'weather': "🌤️ To get current weather information, use the Weather tab. Enter your city name or allow location access to get real-time weather data including temperature, humidity, and wind speed.",
             
             'prices': "💰 Check the Market Prices section for current rates of vegetables and fruits. You can filter by category to see specific produce prices in your area.",
@@ -40,7 +51,56 @@ class VoiceAssistantService:
             'greeting': "👋 Hello! I'm your GrowWise farming assistant. I can help you with weather information, market prices, plant disease detection, and general farming guidance. What would you like to know?",
             
             'default': "🌾 I'm here to help with farming! I can assist with:\n• Weather information\n• Market prices\n• Plant disease detection\n• Soil and fertilizer advice\n• Pest management\n• Cultivation tips\n\nPlease ask me something specific about farming!"
+    })
+
+    # Whole-word greeting set for the fast path: one set probe instead of a
+    # full keyword scan, and no substring false positives ('hi' in 'history')
+    GREETING_WORDS: ClassVar[frozenset] = frozenset({
+        'hello', 'hi', 'hey', 'namaste', 'greetings', 'howdy'
+    })
+    MULTI_WORD_GREETINGS: ClassVar[tuple] = ('good morning', 'good afternoon', 'good evening')
+
+    # Derived lookup structures are pure functions of the frozen mappings
+    # above, so they are built once and cached on the class
+    _keyword_categories: ClassVar[Dict[str, List[str]]] = None
+    _combined_pattern: ClassVar[re.Pattern] = None
+    _category_rank: ClassVar[Dict[str, int]] = None
+    _automaton = None
+
+    def __init__(self):
+        if VoiceAssistantService._keyword_categories is None:
+            self._build_keyword_index()
+
+    @classmethod
+    def _build_keyword_index(cls):
+        """Build the shared keyword lookup structures on first instantiation."""
+        # Single precompiled alternation over every keyword: the whole
+        # classification is one C-level scan of the query. Each hit is mapped
+        # back to its categories (a keyword may score for several); matched
+        # keywords are deduped before scoring so a keyword counts at most
+        # once per category, as in the old per-category membership loops.
+        keyword_categories = {}
+        for category, keywords in cls.query_patterns.items():
+            for keyword in keywords:
+                keyword_categories.setdefault(keyword, []).append(category)
+        cls._keyword_categories = keyword_categories
+        cls._combined_pattern = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, keyword_categories)) + r')\b'
+        )
+        # Declaration order doubles as tie-break priority (greeting first)
+        cls._category_rank = {
+            category: rank for rank, category in enumerate(cls.query_patterns)
         }
+
+        # Optional Aho-Corasick automaton: one pass over the query for all
+        # keywords in O(len(query) + hits). Falls back to the combined regex
+        # when pyahocorasick is not installed.
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword, categories in keyword_categories.items():
+                automaton.add_word(keyword, (keyword, categories))
+            automaton.make_automaton()
+            cls._automaton = automaton
     
     def process_query(self, query: str) -> str:
         """
@@ -52,35 +112,67 @@ class VoiceAssistantService:
         Returns:
             AI assistant response
         """
-        query_lower = query.lower().strip()
-        
-        # Handle greetings
+        # Reject empty/trivial queries before paying for casefolding and the
+        # pattern scan; keywords are stored pre-lowercased so one casefold of
+        # the query is the only normalization needed
+        query = query.strip()
+        if len(query) < 2:
+            return self.responses['default']
+        query_lower = query.casefold()
+
+        # Cheap whole-token pre-check for greetings; anything it misses
+        # (e.g. "hello!" glued to punctuation) is still caught below, where
+        # any greeting hit returns immediately — greetings keep the absolute
+        # priority over scored categories that they have always had
         if self._is_greeting(query_lower):
             return self.responses['greeting']
-        
-        # Check for specific query types with confidence scoring
-        matches = {}
-        for category, keywords in self.query_patterns.items():
-            match_count = sum(1 for keyword in keywords if keyword in query_lower)
-            if match_count > 0:
-                matches[category] = match_count
-        
-        # Return response for category with most matches
-        if matches:
-            best_category = max(matches, key=matches.get)
+
+        # Collect the distinct keywords present first: a keyword repeated in
+        # the query still counts once per category, exactly like the old
+        # per-category membership loops
+        matched = set()
+        if self._automaton is not None:
+            last_index = len(query_lower) - 1
+            for end, (keyword, categories) in self._automaton.iter(query_lower):
+                # The automaton matches raw substrings, so enforce the same
+                # word boundaries the regex path applies
+                start = end - len(keyword) + 1
+                if (start == 0 or not query_lower[start - 1].isalnum()) and \
+                   (end == last_index or not query_lower[end + 1].isalnum()):
+                    matched.add(keyword)
+        else:
+            for match in self._combined_pattern.finditer(query_lower):
+                matched.add(match.group(0))
+
+        # Score the unique keywords with the argmax tracked inline — no
+        # second pass over a matches dict; ties resolve by declaration rank,
+        # matching the old max() semantics
+        counts = {}
+        rank = self._category_rank
+        best_category = None
+        best_count = 0
+        for keyword in matched:
+            for category in self._keyword_categories[keyword]:
+                if category == 'greeting':
+                    return self.responses['greeting']
+                count = counts.get(category, 0) + 1
+                counts[category] = count
+                if count > best_count or (count == best_count and
+                                          rank[category] < rank[best_category]):
+                    best_category = category
+                    best_count = count
+
+        if best_category is not None:
             return self.responses[best_category]
-        
+
         # Default response
         return self.responses['default']
-    
-    def _is_greeting(self, query: str) -> bool:
-        """Check if the query is a greeting."""
-        greetings = [
-            'hello', 'hi', 'hey', 'good morning', 'good afternoon', 
-            'good evening', 'namaste', 'greetings', 'howdy'
-        ]
-        return any(greeting in query for greeting in greetings)
-    
+
+    def _is_greeting(self, query_lower: str) -> bool:
+        """Whole-word greeting test: single tokenization + set intersection."""
+        return bool(self.GREETING_WORDS & set(query_lower.split())) or \
+            query_lower.startswith(self.MULTI_WORD_GREETINGS)
+
     def get_help_response(self) -> Dict[str, List[str]]:
         """Get structured help information."""
         return {
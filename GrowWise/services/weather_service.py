@@ -3,16 +3,35 @@
 import requests
 import logging
 import os
+import time
+import threading
 from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 class WeatherService:
     """Service for fetching weather data from OpenWeatherMap API."""
-    
+
+    # Upstream data refreshes roughly every 10 minutes, so repeated queries
+    # for the same place within that window can share one API call
+    CACHE_TTL_SECONDS = 600
+    CACHE_MAX_ENTRIES = 1024
+
     def __init__(self):
         self.api_key = os.getenv("OPENWEATHER_API_KEY", "7a695b51212a8a83fa11b8fab774eb02")
         self.base_url = "https://api.openweathermap.org/data/2.5/weather"
+        # Shared session: keep-alive connections amortize the TCP+TLS
+        # handshake across calls instead of paying it per request
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        ))
+        self._cache = {}
+        self._cache_lock = threading.Lock()
     
     def get_weather_data(
         self, 
@@ -32,27 +51,35 @@ class WeatherService:
             Dictionary containing weather data
         """
         if lat is not None and lon is not None:
+            # Round coordinates so nearby GPS fixes share a cache entry
+            cache_key = (round(lat, 2), round(lon, 2))
             params = {
-                'lat': lat, 
-                'lon': lon, 
-                'appid': self.api_key, 
+                'lat': lat,
+                'lon': lon,
+                'appid': self.api_key,
                 'units': 'metric'
             }
         elif city:
+            cache_key = city.strip().lower()
             params = {
-                'q': city, 
-                'appid': self.api_key, 
+                'q': city,
+                'appid': self.api_key,
                 'units': 'metric'
             }
         else:
             raise ValueError("Either city name or coordinates are required")
 
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None and time.time() - entry[0] < self.CACHE_TTL_SECONDS:
+                return entry[1]
+
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = self._session.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
-            return {
+            weather = {
                 'city': data['name'],
                 'temperature': data['main']['temp'],
                 'description': data['weather'][0]['description'].title(),
@@ -60,7 +87,15 @@ class WeatherService:
                 'wind_speed': data['wind']['speed'],
                 'country': data['sys']['country']
             }
-            
+
+            # Only successful lookups are cached; errors always retry upstream
+            with self._cache_lock:
+                if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                    self._cache.pop(next(iter(self._cache)))
+                self._cache[cache_key] = (time.time(), weather)
+
+            return weather
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Weather API request error: {e}")
             raise Exception("Weather service is currently unavailable")